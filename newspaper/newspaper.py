@@ -1,3 +1,5 @@
+from pathlib import Path
+
 from fpdf import FPDF
 
 lorem_ipsum = """Lorem ipsum dolor sit amet, consectetur adipiscing elit. Sed efficitur sem lectus, in tincidunt lectus suscipit id.
@@ -6,62 +8,93 @@ Suspendisse id dignissim nisl, in commodo justo. Donec cursus interdum euismod.
 
 Cras et tellus et augue egestas tincidunt. Aenean elit nisl, volutpat vitae dictum vitae, consequat at risus"""
 
-pdf = FPDF()
-
-pdf.add_page()
-
-# write the big title
-pdf.set_font("Times", "B", 50)
-pdf.cell(w=pdf.epw, text="HEADLINE", align="c", new_x="LEFT", new_y="NEXT")
-
-pdf.set_font("Times", "B", 30)
-pdf.cell(
-    w=pdf.epw,
-    text="SUBTITLE HERE",
-    align="c",
-    new_x="LEFT",
-    new_y="NEXT",
-)
-
-# the first article takes 2/3 of the page from here.
-# save the "y" position to write the second article
-articles_start = pdf.get_y()
-article_width = pdf.epw * 2 / 3 - 2
-
-# first article - image + headline + text in 2 columns
-pdf.image(name="just-chillin.jpeg", w=article_width)
-
-pdf.set_font("Times", "B", 20)
-pdf.multi_cell(text="This is the first article's headline", w=article_width, align="c")
-
-pdf.set_font("Times", "", 14)
-with pdf.text_columns(
-    text=lorem_ipsum,
-    text_align="J",
-    ncols=2,
-    r_margin=(pdf.epw - article_width + pdf.r_margin),
-    gutter=1,
-) as cols:
-    cols.write(lorem_ipsum)
-
-# second article - 1/3 of the page
-article_width = pdf.epw * 1 / 3
-article_x_pos = (pdf.epw * 2 / 3) + pdf.l_margin
-
-pdf.set_xy(x=article_x_pos, y=articles_start)
-
-pdf.image(name="hiding.jpg", w=article_width)
-
-pdf.set_font("Times", "B", 20)
-pdf.set_x(article_x_pos)
-pdf.multi_cell(text="This is the second article's headline", w=article_width, align="c")
-
-pdf.set_font("Times", "", 14)
-pdf.set_x(article_x_pos)
-with pdf.text_columns(
-    text=lorem_ipsum, text_align="J", ncols=1, l_margin=article_x_pos, gutter=1
-) as cols:
-    cols.write(lorem_ipsum)
-
-# write output file
-pdf.output("newspaper.pdf")
+
+def build_newspaper(pdf, headline, subtitle, articles):
+    """Add a newspaper page to `pdf`.
+
+    `articles` is a pair of (headline, image, text) tuples: the first article
+    takes 2/3 of the page with its text in 2 columns, the second one the
+    remaining 1/3. Calling this repeatedly on the same FPDF instance adds one
+    page per issue and reuses the images fpdf2 has already cached.
+    """
+    first_headline, first_image, first_text = articles[0]
+    second_headline, second_image, second_text = articles[1]
+
+    pdf.add_page()
+
+    # page geometry used throughout the layout
+    epw, l_margin, r_margin = pdf.epw, pdf.l_margin, pdf.r_margin
+
+    # write the big title
+    pdf.set_font("Times", "B", 50)
+    pdf.cell(w=epw, text=headline, align="c", new_x="LEFT", new_y="NEXT")
+
+    pdf.set_font("Times", "B", 30)
+    pdf.cell(
+        w=epw,
+        text=subtitle,
+        align="c",
+        new_x="LEFT",
+        new_y="NEXT",
+    )
+
+    # the first article takes 2/3 of the page from here.
+    # save the "y" position to write the second article
+    articles_start = pdf.get_y()
+    article_width_2_3 = epw * 2 / 3 - 2
+    article_x_pos = epw * 2 / 3 + l_margin
+
+    # first article - image + headline + text in 2 columns
+    pdf.image(name=first_image, w=article_width_2_3)
+
+    pdf.set_font("Times", "B", 20)
+    pdf.multi_cell(text=first_headline, w=article_width_2_3, align="c")
+
+    pdf.set_font("Times", "", 14)
+    with pdf.text_columns(
+        text=first_text,
+        text_align="J",
+        ncols=2,
+        r_margin=(epw - article_width_2_3 + r_margin),
+        gutter=1,
+    ) as cols:
+        cols.write(first_text)
+
+    # second article - 1/3 of the page
+    article_width = epw * 1 / 3
+
+    pdf.set_xy(x=article_x_pos, y=articles_start)
+
+    pdf.image(name=second_image, w=article_width)
+
+    pdf.set_font("Times", "B", 20)
+    pdf.set_x(article_x_pos)
+    pdf.multi_cell(text=second_headline, w=article_width, align="c")
+
+    pdf.set_font("Times", "", 14)
+    pdf.set_x(article_x_pos)
+    with pdf.text_columns(
+        text=second_text, text_align="J", ncols=1, l_margin=article_x_pos, gutter=1
+    ) as cols:
+        cols.write(second_text)
+
+
+if __name__ == "__main__":
+    # read the images only once - fpdf2 embeds the JPEG bytes as they are
+    # and caches them by content, so reusing them costs no disk I/O or decoding
+    first_image = Path("just-chillin.jpeg").read_bytes()
+    second_image = Path("hiding.jpg").read_bytes()
+
+    pdf = FPDF()
+    build_newspaper(
+        pdf,
+        "HEADLINE",
+        "SUBTITLE HERE",
+        [
+            ("This is the first article's headline", first_image, lorem_ipsum),
+            ("This is the second article's headline", second_image, lorem_ipsum),
+        ],
+    )
+
+    # write output file
+    pdf.output("newspaper.pdf")